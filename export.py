@@ -0,0 +1,231 @@
+import csv
+import math
+import os
+import struct
+import zipfile
+import numpy as np
+import scipy.stats as st
+
+
+# number of rows (values of x) computed and written at a time
+DEFAULT_CHUNK_SIZE = 10**6
+# columns written for every export, in order
+COLUMNS = ('x', 'pmf', 'cdf', 'sf', 'normal', 'sim_count')
+COLUMN_DTYPES = {
+	'x': np.dtype('<i8'),
+	'pmf': np.dtype('<f8'),
+	'cdf': np.dtype('<f8'),
+	'sf': np.dtype('<f8'),
+	'normal': np.dtype('<f8'),
+	'sim_count': np.dtype('<i8'),
+}
+FORMATS = ('npz', 'parquet', 'csv')
+# size of the fixed part of a zip local file header, followed by the file name and extra field
+ZIP_LOCAL_HEADER_SIZE = 30
+
+
+# guess export format from the file extension of path
+def format_from_path(path: str) -> str:
+	ext = os.path.splitext(path)[1].lower().lstrip('.')
+	if ext == 'pq':
+		ext = 'parquet'
+	if ext not in FORMATS:
+		raise ValueError(f'Cannot infer export format from {path!r}, expected one of {FORMATS}')
+	return ext
+
+
+# simulated counts kept as sorted outcomes with their counts, so memory grows with the number of distinct outcomes
+# rather than with n
+class SparseCounts(object):
+	def __init__(self, outcomes: np.ndarray, counts: np.ndarray):
+		self.outcomes = outcomes
+		self.counts = counts
+
+	# adds the counts of another set of sorted outcomes
+	def merge(self, outcomes: np.ndarray, counts: np.ndarray) -> None:
+		all_outcomes = np.concatenate((self.outcomes, outcomes))
+		all_counts = np.concatenate((self.counts, counts))
+		self.outcomes, inverse = np.unique(all_outcomes, return_inverse=True)
+		self.counts = np.bincount(inverse, weights=all_counts, minlength=len(self.outcomes)).astype(
+			COLUMN_DTYPES['sim_count'])
+
+	# dense counts for x in [start, stop)
+	def chunk(self, start: int, stop: int) -> np.ndarray:
+		dense = np.zeros(stop - start, dtype=COLUMN_DTYPES['sim_count'])
+		lo, hi = np.searchsorted(self.outcomes, [start, stop])
+		dense[self.outcomes[lo:hi] - start] = self.counts[lo:hi]
+		return dense
+
+
+# simulated counts for x in [start, stop)
+# counts can be None (no simulations), SparseCounts, a dict like Binomial.approximate_count_distribution,
+# or an array of length n+1
+def counts_chunk(counts, start: int, stop: int) -> np.ndarray:
+	if counts is None:
+		return np.zeros(stop - start, dtype=COLUMN_DTYPES['sim_count'])
+	if isinstance(counts, SparseCounts):
+		return counts.chunk(start, stop)
+	if isinstance(counts, dict):
+		return np.fromiter((counts.get(x, 0) for x in range(start, stop)), dtype=COLUMN_DTYPES['sim_count'],
+		                   count=stop - start)
+	return np.asarray(counts[start:stop], dtype=COLUMN_DTYPES['sim_count'])
+
+
+# computes a single exported column for x in [start, stop)
+def compute_column(column: str, x: np.ndarray, n: int, p: float, counts) -> np.ndarray:
+	if column == 'x':
+		return x
+	if column == 'pmf':
+		return st.binom.pmf(x, n, p)
+	if column == 'cdf':
+		return st.binom.cdf(x, n, p)
+	if column == 'sf':
+		return st.binom.sf(x, n, p)
+	if column == 'normal':
+		# normal approximation with continuity correction, same as Binomial.normal_cdf(x-.5, x+.5)
+		mu = n * p
+		sigma = math.sqrt(n * p * (1 - p))
+		if sigma == 0:
+			return (x == mu).astype(COLUMN_DTYPES['normal'])
+		return st.norm.cdf(x + .5, mu, sigma) - st.norm.cdf(x - .5, mu, sigma)
+	if column == 'sim_count':
+		return counts_chunk(counts, int(x[0]), int(x[-1]) + 1)
+	raise ValueError(f'Invalid column {column!r}, expected one of {COLUMNS}')
+
+
+# yields the requested columns for the binomial distribution with n trials and p probability of success,
+# chunk_size rows at a time, so that no more than one chunk is ever held in memory
+def iter_chunks(n: int, p: float, counts=None, chunk_size: int = DEFAULT_CHUNK_SIZE, columns=COLUMNS):
+	if n < 1:
+		raise ValueError('Number of trials (n) must be greater than 0')
+	if not (0 <= p <= 1):
+		raise ValueError('Probability (p) must be between 0 and 1 inclusive')
+	if chunk_size < 1:
+		raise ValueError('Chunk size must be greater than 0')
+	if counts is not None and not isinstance(counts, (dict, SparseCounts)) and len(counts) != n + 1:
+		raise ValueError('Simulated counts must have exactly n + 1 values')
+
+	for start in range(0, n + 1, chunk_size):
+		stop = min(start + chunk_size, n + 1)
+		x = np.arange(start, stop, dtype=COLUMN_DTYPES['x'])
+		yield {column: compute_column(column, x, n, p, counts) for column in columns}
+
+
+# writes every column to an uncompressed npz archive, streaming each column chunk by chunk
+# only the column being written is computed on each pass
+# members are stored uncompressed so that load_export can memory map them
+def write_npz(path: str, n: int, p: float, counts, chunk_size: int) -> None:
+	rows = n + 1
+	with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+		for column in COLUMNS:
+			dtype = COLUMN_DTYPES[column]
+			with archive.open(f'{column}.npy', 'w', force_zip64=True) as member:
+				np.lib.format.write_array_header_2_0(member, {
+					'descr': np.lib.format.dtype_to_descr(dtype),
+					'fortran_order': False,
+					'shape': (rows,),
+				})
+				for chunk in iter_chunks(n, p, counts, chunk_size, (column,)):
+					member.write(chunk[column].astype(dtype, copy=False).tobytes())
+
+
+# writes every column to an uncompressed parquet file, one row group per chunk
+def write_parquet(path: str, n: int, p: float, counts, chunk_size: int) -> None:
+	try:
+		import pyarrow as pa
+		import pyarrow.parquet as pq
+	except ImportError:
+		raise ImportError('pyarrow is required to export to parquet')
+
+	schema = pa.schema([(column, pa.from_numpy_dtype(COLUMN_DTYPES[column])) for column in COLUMNS])
+	with pq.ParquetWriter(path, schema, compression='none') as writer:
+		for chunk in iter_chunks(n, p, counts, chunk_size):
+			writer.write_table(pa.table({column: chunk[column] for column in COLUMNS}, schema=schema))
+
+
+# writes every column to a csv file with a header row, chunk by chunk
+def write_csv(path: str, n: int, p: float, counts, chunk_size: int) -> None:
+	with open(path, 'w', newline='') as f:
+		writer = csv.writer(f)
+		writer.writerow(COLUMNS)
+		for chunk in iter_chunks(n, p, counts, chunk_size):
+			writer.writerows(zip(*(chunk[column].tolist() for column in COLUMNS)))
+
+
+WRITERS = {
+	'npz': write_npz,
+	'parquet': write_parquet,
+	'csv': write_csv,
+}
+
+
+# exports the pmf, cdf, survival function, normal approximation and simulated counts of the binomial distribution
+# with n trials and p probability of success to path
+# fmt is one of FORMATS, inferred from the file extension if not given
+def export_distribution(path: str, n: int, p: float, counts=None, fmt: str = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+	if fmt is None:
+		fmt = format_from_path(path)
+	if fmt not in WRITERS:
+		raise ValueError(f'Invalid export format {fmt!r}, expected one of {FORMATS}')
+	WRITERS[fmt](path, n, p, counts, chunk_size)
+
+
+# exports an existing Binomial, including the simulations run on it so far
+def export_binomial(binomial, path: str, fmt: str = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+	export_distribution(path, binomial.n, binomial.p, binomial.approximate_count_distribution, fmt, chunk_size)
+
+
+# simulates sim_num binomial trials in batches and returns the count of each number of successes that occurred
+def simulate_counts(n: int, p: float, sim_num: int, batch_size: int = DEFAULT_CHUNK_SIZE) -> SparseCounts:
+	rng = np.random.default_rng()
+	counts = SparseCounts(np.empty(0, dtype=COLUMN_DTYPES['x']), np.empty(0, dtype=COLUMN_DTYPES['sim_count']))
+	done = 0
+	while done < sim_num:
+		batch = min(batch_size, sim_num - done)
+		counts.merge(*np.unique(rng.binomial(n, p, batch), return_counts=True))
+		done += batch
+	return counts
+
+
+# memory maps a single stored .npy member of an npz archive
+def memmap_npz_member(path: str, f, info: zipfile.ZipInfo) -> np.memmap:
+	if info.compress_type != zipfile.ZIP_STORED:
+		raise ValueError(f'{info.filename} is compressed and cannot be memory mapped')
+	f.seek(info.header_offset)
+	local_header = f.read(ZIP_LOCAL_HEADER_SIZE)
+	name_len, extra_len = struct.unpack('<HH', local_header[26:30])
+	f.seek(info.header_offset + ZIP_LOCAL_HEADER_SIZE + name_len + extra_len)
+	version = np.lib.format.read_magic(f)
+	if version == (1, 0):
+		shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+	else:
+		shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+	order = 'F' if fortran_order else 'C'
+	return np.memmap(path, dtype=dtype, mode='r', offset=f.tell(), shape=shape, order=order)
+
+
+# opens an export without reading it into memory
+# npz exports return a dict of column name to read only np.memmap
+# parquet exports return a memory mapped pyarrow ParquetFile, read one row group at a time with read_row_group
+# csv exports cannot be memory mapped, export to npz or parquet instead
+def load_export(path: str, fmt: str = None):
+	if fmt is None:
+		fmt = format_from_path(path)
+	if fmt == 'npz':
+		columns = {}
+		with zipfile.ZipFile(path) as archive, open(path, 'rb') as f:
+			for info in archive.infolist():
+				name, ext = os.path.splitext(info.filename)
+				if ext == '.npy':
+					columns[name] = memmap_npz_member(path, f, info)
+		return columns
+	if fmt == 'parquet':
+		try:
+			import pyarrow.parquet as pq
+		except ImportError:
+			raise ImportError('pyarrow is required to load parquet exports')
+		return pq.ParquetFile(path, memory_map=True)
+	if fmt == 'csv':
+		raise ValueError('csv exports cannot be memory mapped, export to npz or parquet instead')
+	raise ValueError(f'Invalid export format {fmt!r}, expected one of {FORMATS}')
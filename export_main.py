@@ -0,0 +1,27 @@
+import argparse
+from export import DEFAULT_CHUNK_SIZE, FORMATS, export_distribution, simulate_counts
+
+
+# parses command line arguments for exporting a binomial distribution
+def parse_args():
+	parser = argparse.ArgumentParser(description='Export a binomial distribution to npz, parquet, or csv')
+	parser.add_argument('n', type=int, help='number of trials')
+	parser.add_argument('p', type=float, help='probability of success for each trial')
+	parser.add_argument('path', help='output file, format is inferred from its extension unless --format is given')
+	parser.add_argument('--format', choices=FORMATS, default=None, help='output format')
+	parser.add_argument('--sims', type=int, default=0, help='number of simulated trials to include')
+	parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+	                    help='number of rows computed and written at a time')
+	return parser.parse_args()
+
+
+def main():
+	args = parse_args()
+	counts = None
+	if args.sims > 0:
+		counts = simulate_counts(args.n, args.p, args.sims, args.chunk_size)
+	export_distribution(args.path, args.n, args.p, counts, args.format, args.chunk_size)
+
+
+if __name__ == '__main__':
+	main()
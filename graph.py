@@ -1,7 +1,9 @@
 import tkinter as tk
 import matplotlib.pyplot as plt
+import numpy as np
 from my_stats import Binomial
 from my_stats import normal
+from sweep import sweep
 
 
 # fill colors for graph gui
@@ -11,6 +13,8 @@ from my_stats import normal
 UPPER_COLORS = ['w', 'lightblue', 'cornflowerblue', 'darkblue']
 # lower colors: for simulated binomial distribution
 LOWER_COLORS = ['w', 'lightgreen', 'limegreen', 'darkgreen']
+# width of the heatmap cell when a sweep has only one value of p
+SWEEP_SINGLE_P_WIDTH = .01
 
 
 # selects range to view cumulative probability between lower and upper bound
@@ -41,6 +45,8 @@ class MouseHandler(object):
 		self.binomial = binomial
 		self.colors = colors
 		self.clickable = clickable
+		# handler of the other bar graph sharing the sidebar, only one of them holds a selection at a time
+		self.partner = None
 
 		self.current_hover = None
 		self.current_click = None
@@ -136,15 +142,21 @@ class MouseHandler(object):
 		self.fig.canvas.draw_idle()
 
 		if bar_ind is not None:
-			full_dict = self.binomial.binomial_full(bar_ind)
-			all_prob = ''
-			# add every type of probability to the sidebar
-			for key in full_dict:
-				all_prob += f'P(x{key}{bar_ind}) = {round(full_dict.get(key), 5)}\n'
-			self.full_prob_msg.config(text=all_prob)
+			self.show_full_prob()
 		else:
 			self.full_prob_msg.config(text='')
 
+	# shows every type of probability for the clicked bar in the sidebar, with simulated probabilities if any
+	def show_full_prob(self):
+		full_dict = self.binomial.binomial_full(self.current_click)
+		sim_dict = self.binomial.simulated_full(self.current_click)
+		all_prob = ''
+		for key in full_dict:
+			all_prob += f'P(x{key}{self.current_click}) = {round(full_dict.get(key), 5)}\n'
+			if self.binomial.total_sims > 0:
+				all_prob += f'  Sim = {round(sim_dict.get(key), 5)}\n'
+		self.full_prob_msg.config(text=all_prob)
+
 	# handles right click on bar
 	def right_click(self, bar_ind: int):
 		previous_l, previous_r = self.current_left, self.current_right
@@ -162,10 +174,37 @@ class MouseHandler(object):
 		# second click, color all bars between left and right (lower and upper bound), inclusive
 		if self.current_left is not None and self.current_right is not None:
 			self.update_bar_color_in_range(self.current_left, self.current_right)
-			cum_prob = f'P({self.current_left}<=x<={self.current_right}) = {round(self.binomial.binomial_cdf(self.current_left, self.current_right), 5)}'
-			cum_prob += f'\n\nNormal Approx = {round(self.binomial.normal_cdf(self.current_left-.5, self.current_right+.5), 5)}'
-			print(cum_prob)
-			self.cum_prob_msg.config(text=cum_prob)
+			self.show_cum_prob()
+
+	# shows exact, normal approximation, and simulated probability of the selected range in the sidebar
+	def show_cum_prob(self):
+		cum_prob = f'P({self.current_left}<=x<={self.current_right}) = {round(self.binomial.binomial_cdf(self.current_left, self.current_right), 5)}'
+		cum_prob += f'\n\nNormal Approx = {round(self.binomial.normal_cdf(self.current_left-.5, self.current_right+.5), 5)}'
+		if self.binomial.total_sims > 0:
+			cum_prob += f'\n\nSimulated = {round(self.binomial.simulated_cdf(self.current_left, self.current_right), 5)}'
+		self.cum_prob_msg.config(text=cum_prob)
+
+	# refreshes the sidebar for the current selections after simulations are added or cleared
+	def refresh_prob_msgs(self):
+		if self.current_click is not None:
+			self.show_full_prob()
+		if self.current_left is not None and self.current_right is not None:
+			self.show_cum_prob()
+
+	# clears this bar graph's selections and the sidebar text they own
+	def clear_selection(self):
+		if self.current_click is not None:
+			previous = self.current_click
+			self.current_click = None
+			self.update_bar_color(previous)
+			self.full_prob_msg.config(text='')
+		if self.current_left is not None:
+			previous_l = self.current_left
+			previous_r = self.current_right if self.current_right is not None else previous_l
+			self.current_left, self.current_right = None, None
+			self.update_bar_color_in_range(previous_l, previous_r)
+			self.cum_prob_msg.config(text='')
+		self.fig.canvas.draw_idle()
 
 	# handles generic click, calls left or right click accordingly
 	def click(self, event):
@@ -173,6 +212,9 @@ class MouseHandler(object):
 			for i, bar in enumerate(self.bars.patches):
 				cont, ind = bar.contains(event)
 				if cont:
+					# the sidebar now belongs to this bar graph
+					if self.partner is not None and event.button in (1, 3):
+						self.partner.clear_selection()
 					if event.button == 1:
 						self.left_click(i)
 						return
@@ -265,7 +307,15 @@ class Graph(object):
 		self.upper_mouse_handler = MouseHandler(self.fig, self.upper, self.upper_bars, self.binomial,
 		                                        UPPER_COLORS, self.full_prob_msg, self.cum_prob_msg, True)
 		self.lower_mouse_handler = MouseHandler(self.fig, self.lower, self.lower_bars, self.binomial,
-		                                        LOWER_COLORS, self.full_prob_msg, self.cum_prob_msg, False)
+		                                        LOWER_COLORS, self.full_prob_msg, self.cum_prob_msg, True)
+		self.upper_mouse_handler.partner = self.lower_mouse_handler
+		self.lower_mouse_handler.partner = self.upper_mouse_handler
+
+	# update the sidebar so simulated probabilities match the current simulations
+	# at most one of the bar graphs holds a selection, so only its text is rewritten
+	def refresh_prob_msgs(self):
+		self.upper_mouse_handler.refresh_prob_msgs()
+		self.lower_mouse_handler.refresh_prob_msgs()
 
 	# perform more simulations
 	def add_sims(self, sim_num):
@@ -277,6 +327,7 @@ class Graph(object):
 			bar.set_height(self.binomial.approximate_freq_distribution.get(succ))
 			succ += 1
 		self.update_lower()
+		self.refresh_prob_msgs()
 		self.fig.canvas.draw_idle()
 
 	# clear all simulations
@@ -285,11 +336,78 @@ class Graph(object):
 		for bar in self.lower_bars:
 			bar.set_height(0)
 		self.update_lower()
+		self.refresh_prob_msgs()
 		self.fig.canvas.draw_idle()
 
 
+# label for a sweep query, in the same notation as the probability sidebar
+def query_label(mode: str, x: int, right: int = None) -> str:
+	if mode == 'range':
+		return f'P({x}<=x<={right})'
+	return f'P(x{mode}{x})'
 
 
+# Handles display of a heatmap of one query swept over a grid of n and p values
+class SweepGraph(object):
 
+	# computes the sweep and creates the heatmap
+	def __init__(self, n_values, p_values, mode: str, x: int, right: int = None):
+		self.n_values = n_values
+		self.p_values = p_values
+		self.label = query_label(mode, x, right)
+		self.values = sweep(n_values, p_values, mode, x, right)
 
+		self.create_fig()
+		self.create_annot()
+		self.fig.canvas.mpl_connect('motion_notify_event', self.hover)
 
+	# close figure
+	def close(self):
+		plt.close(self.fig)
+
+	# create figure, each cell is centered on its (p, n) value
+	def create_fig(self):
+		self.fig, self.axes = plt.subplots(figsize=(8, 6))
+		self.fig.suptitle(f'{self.label} by n and p')
+		# a grid with a single value has no spacing, draw it one trial tall or SWEEP_SINGLE_P_WIDTH wide instead
+		p_step = SWEEP_SINGLE_P_WIDTH
+		if len(self.p_values) > 1:
+			p_step = (self.p_values[-1] - self.p_values[0]) / (len(self.p_values) - 1)
+		n_step = 1
+		if len(self.n_values) > 1:
+			n_step = (self.n_values[-1] - self.n_values[0]) / (len(self.n_values) - 1)
+		extent = [self.p_values[0] - p_step / 2, self.p_values[-1] + p_step / 2,
+		          self.n_values[0] - n_step / 2, self.n_values[-1] + n_step / 2]
+		self.image = self.axes.imshow(self.values, origin='lower', aspect='auto', extent=extent,
+		                              vmin=0, vmax=1, cmap='Blues', interpolation='nearest')
+		self.fig.colorbar(self.image, ax=self.axes, label='Probability')
+		self.axes.set_xlabel('p')
+		self.axes.set_ylabel('n')
+
+	# creates annotation displaying the probability of the hovered cell
+	def create_annot(self):
+		self.annot = self.axes.annotate('', xy=(0, 0), xytext=(0, 20), textcoords='offset points',
+		                                zorder=100,
+		                                bbox=dict(boxstyle='round', fc='white', ec='black', lw=.75),
+		                                arrowprops=dict(arrowstyle='->'))
+		self.annot.set_visible(False)
+
+	# index of the grid value closest to v
+	@staticmethod
+	def nearest(grid, v) -> int:
+		return int(np.abs(np.asarray(grid) - v).argmin())
+
+	# handles mouse hover over the heatmap
+	def hover(self, event):
+		if event.inaxes == self.axes:
+			n_ind = self.nearest(self.n_values, event.ydata)
+			p_ind = self.nearest(self.p_values, event.xdata)
+			n, p = self.n_values[n_ind], self.p_values[p_ind]
+			self.annot.xy = (p, n)
+			self.annot.set_text(f'n={n}, p={round(p, 5)}\n'
+			                    f'{self.label} = {round(self.values[n_ind, p_ind], 5)}')
+			self.annot.set_visible(True)
+			self.fig.canvas.draw_idle()
+		elif self.annot.get_visible():
+			self.annot.set_visible(False)
+			self.fig.canvas.draw_idle()
@@ -6,7 +6,8 @@ if sys_pf == 'darwin':
     matplotlib.use("TkAgg")
 
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from graph import Graph
+from graph import Graph, SweepGraph
+import numpy as np
 import tkinter as tk
 
 
@@ -25,6 +26,9 @@ FONT = ('Verdana', 14)
 VALID_COLOR = 'white'
 # red color should be displayed if user input is invalid
 ERROR_COLOR = '#ff3333'
+# sweep heatmap covers n from 1 to SWEEP_MAX_N and SWEEP_P_STEPS evenly spaced values of p from 0 to 1
+SWEEP_MAX_N = 200
+SWEEP_P_STEPS = 101
 
 
 # handles user input into entry box
@@ -85,6 +89,31 @@ def check_sims(sims_str: str):
     return sims
 
 
+# check if user input for a sweep query is valid
+# a must be a non-negative integer no greater than SWEEP_MAX_N, b must be empty or an integer greater than or equal to a
+# returns the sweep mode, a, b, and an error message
+def check_sweep(a_str: str, b_str: str) -> (str, int, int, str):
+    try:
+        a = int(a_str)
+    except ValueError:
+        return None, None, None, 'a must be an integer'
+    if a < 0:
+        return None, None, None, 'a must not be negative'
+    # P(X >= a) is 0 for every n in the sweep
+    if a > SWEEP_MAX_N:
+        return None, None, None, f'a must be at most {SWEEP_MAX_N}, the largest n in the sweep'
+    # only a given, sweep P(X >= a)
+    if b_str.strip() == '':
+        return '>=', a, None, ''
+    try:
+        b = int(b_str)
+    except ValueError:
+        return None, None, None, 'b must be an integer or empty'
+    if b < a:
+        return None, None, None, 'b must be greater than or equal to a'
+    return 'range', a, b, ''
+
+
 # handles BinomialMachineGUI
 class Gui(object):
 
@@ -139,6 +168,17 @@ class Gui(object):
         sims_error_msg = tk.Message(frame_l, text='', font=FONT)
         sims_error_msg.grid(row=5, column=0, sticky=ALIGNMENT)
 
+        # sweep P(a<=X<=b), or P(X>=a) if b is empty, over a grid of n and p
+        sweep_frame = tk.Frame(frame_l, padx=10, bg='white')
+        sweep_frame.grid(row=6, column=0, sticky=ALIGNMENT)
+        a_handler = EntryHandler('a =', '', sweep_frame, 0, 0)
+        b_handler = EntryHandler('b =', '', sweep_frame, 1, 0)
+        sweep_button = tk.Button(sweep_frame, text='Sweep', width=ENTRY_WIDTH, font=FONT)
+        sweep_button.grid(row=2, column=1)
+
+        sweep_error_msg = tk.Message(frame_l, text='', font=FONT)
+        sweep_error_msg.grid(row=7, column=0, sticky=ALIGNMENT)
+
         # right side
         frame_r = tk.Frame(self.window, padx=10, bg='white')
         frame_r.grid(row=0, column=2, sticky=ALIGNMENT)
@@ -205,6 +245,20 @@ class Gui(object):
         def clear_sims(event):
             self.graph.clear_sims()
 
+        # show heatmap of the sweep query in a new window
+        def sweep(event):
+            a_entry = a_handler.entry
+            b_entry = b_handler.entry
+            mode, a, b, msg = check_sweep(a_entry.get(), b_entry.get())
+            sweep_error_msg.config(text=msg)
+            if mode is None:
+                set_entries_color(a_entry, ERROR_COLOR)
+                set_entries_color(b_entry, ERROR_COLOR)
+                return
+            set_entries_color(a_entry, VALID_COLOR)
+            set_entries_color(b_entry, VALID_COLOR)
+            self.show_sweep(mode, a, b)
+
         # ask to confirm quit
         def on_closing():
             if tk.messagebox.askokcancel("Quit", "Do you want to quit?"):
@@ -216,6 +270,7 @@ class Gui(object):
         add_button.bind('<Button-1>', add_sims)
         enter_button.bind('<Button-1>', entry_enter)
         clear_button.bind('<Button-1>', clear_sims)
+        sweep_button.bind('<Button-1>', sweep)
 
     # set new graph and embed it in the tkinter window
     def set_graph(self, window, n: int, p: float):
@@ -236,6 +291,24 @@ class Gui(object):
         canvas.draw()
         canvas.get_tk_widget().grid(row=0, column=1)
 
+    # compute a sweep over n and p and embed its heatmap in a new window
+    def show_sweep(self, mode: str, a: int, b: int):
+        sweep_graph = SweepGraph(np.arange(1, SWEEP_MAX_N + 1), np.linspace(0, 1, SWEEP_P_STEPS), mode, a, b)
+
+        sweep_window = tk.Toplevel(self.window)
+        sweep_window.title(f'The Binomial Machine - {sweep_graph.label}')
+
+        canvas = FigureCanvasTkAgg(sweep_graph.fig, master=sweep_window)
+        canvas.get_tk_widget().pack(fill='both', expand=True)
+        canvas.draw()
+
+        # close the figure along with its window
+        def on_sweep_closing():
+            sweep_graph.close()
+            sweep_window.destroy()
+
+        sweep_window.protocol('WM_DELETE_WINDOW', on_sweep_closing)
+
     def show(self):
         self.window.mainloop()
 
@@ -35,6 +35,43 @@ def percent_chance(chance: float) -> bool:
 	return random.random() < chance
 
 
+# binary indexed tree over values 0 to size-1
+# supports adding to a single value and summing any range of values in O(log size)
+class FenwickTree(object):
+	def __init__(self, size: int):
+		self.size = size
+		# tree[i] holds the sum of the values in (i - lowbit(i), i], shifted by one so index 0 is unused
+		self.tree = [0] * (size + 1)
+
+	# adds delta to the value at index
+	def add(self, index: int, delta: int) -> None:
+		i = index + 1
+		while i <= self.size:
+			self.tree[i] += delta
+			i += i & -i
+
+	# sum of the values from 0 to index inclusive
+	def prefix_sum(self, index: int) -> int:
+		total = 0
+		i = min(index, self.size - 1) + 1
+		while i > 0:
+			total += self.tree[i]
+			i -= i & -i
+		return total
+
+	# sum of the values from left to right inclusive
+	def range_sum(self, left: int, right: int) -> int:
+		if left > right:
+			raise ValueError('Left must be less than or equal to right')
+		if left <= 0:
+			return self.prefix_sum(right)
+		return self.prefix_sum(right) - self.prefix_sum(left - 1)
+
+	# resets every value to 0
+	def clear(self) -> None:
+		self.tree = [0] * (self.size + 1)
+
+
 # represents a binomial distribution
 class Binomial(object):
 	# construct a binomial distribution with n trials and p probability of success for each trial
@@ -46,6 +83,8 @@ class Binomial(object):
 		self.approximate_count_distribution = {}
 		self.approximate_freq_distribution = {}
 		self.total_sims = 0
+		# simulated counts for range queries, kept in sync with approximate_count_distribution
+		self.sim_tree = FenwickTree(n + 1)
 		# fill exact_distribution with actual computed probabilities
 		# fill approximate_count and approximate_freq with 0 for now, no simulations run
 		for i in range(n + 1):
@@ -92,7 +131,6 @@ class Binomial(object):
 
 	# calculates cumulative probabliity between two values
 	def binomial_cdf(self, left: int, right: int) -> float:
-		print(f'{left=}, {right=}')
 		if left > right:
 			raise ValueError('Left must be less than or equal to right')
 		total = 0
@@ -108,22 +146,44 @@ class Binomial(object):
 		l_z = (left - mu) / sigma
 		return NormalDist().cdf(r_z) - NormalDist().cdf(l_z)
 
+	# calculates simulated cumulative probability between two values
+	def simulated_cdf(self, left: int, right: int) -> float:
+		if self.total_sims == 0:
+			return 0
+		return self.sim_tree.range_sum(left, right) / self.total_sims
+
+	# calculates simulated probabilities for the same modes as binomial_full
+	def simulated_full(self, x: int) -> dict:
+		return {
+			'=': self.simulated_cdf(x, x),
+			'<': self.simulated_cdf(0, x - 1) if x > 0 else 0,
+			'<=': self.simulated_cdf(0, x),
+			'>': self.simulated_cdf(x + 1, self.n) if x < self.n else 0,
+			'>=': self.simulated_cdf(x, self.n),
+		}
+
 	# simulate sim_num binomial trials
 	def add_sims(self, sim_num: int) -> None:
 		self.total_sims += sim_num
+		batch_counts = {}
 		for sim in range(sim_num):
 			# do one simulation
 			x = 0
 			for i in range(self.n):
 				if percent_chance(self.p):
 					x += 1
-			self.approximate_count_distribution[x] += 1
+			batch_counts[x] = batch_counts.get(x, 0) + 1
+		# one tree update per distinct outcome in the batch
+		for x, count in batch_counts.items():
+			self.approximate_count_distribution[x] += count
+			self.sim_tree.add(x, count)
 		for x in range(self.n + 1):
 			self.approximate_freq_distribution[x] = self.approximate_count_distribution[x] / self.total_sims
 
 	# reset simulations to 0
 	def clear_sims(self) -> None:
 		self.total_sims = 0
+		self.sim_tree.clear()
 		for x in range(self.n+1):
 			self.approximate_count_distribution[x] = 0
 			self.approximate_freq_distribution[x] = 0
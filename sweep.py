@@ -0,0 +1,64 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import scipy.stats as st
+
+
+# queries that can be swept, same inequality symbols as Binomial.binomial_full, plus 'range' for P(x<=X<=right)
+MODES = ('=', '<', '<=', '>', '>=', 'range')
+# grids with fewer cells than this are computed in the current process, starting workers would cost more
+MIN_PARALLEL_CELLS = 10**6
+
+
+# evaluates the query for every pair of n_values (column vector) and p_values (row vector) at once
+def evaluate(n_values: np.ndarray, p_values: np.ndarray, mode: str, x: int, right: int = None) -> np.ndarray:
+	n = np.asarray(n_values)[:, np.newaxis]
+	p = np.asarray(p_values)[np.newaxis, :]
+	if mode == '=':
+		return st.binom.pmf(x, n, p)
+	if mode == '<':
+		return st.binom.cdf(x - 1, n, p)
+	if mode == '<=':
+		return st.binom.cdf(x, n, p)
+	if mode == '>':
+		return st.binom.sf(x, n, p)
+	if mode == '>=':
+		return st.binom.sf(x - 1, n, p)
+	if mode == 'range':
+		return st.binom.cdf(right, n, p) - st.binom.cdf(x - 1, n, p)
+	raise ValueError('Invalid mode selected')
+
+
+# computes the probability of the query for every combination of n in n_values and p in p_values
+# returns an array of shape (len(n_values), len(p_values))
+# mode is one of MODES, x is the value compared against, right is the upper bound for 'range'
+# large grids are split along n across up to workers processes
+def sweep(n_values, p_values, mode: str, x: int, right: int = None, workers: int = None) -> np.ndarray:
+	n_array = np.asarray(n_values)
+	n_values = n_array.astype(int)
+	if np.any(n_values != n_array):
+		raise ValueError('Number of trials (n) must be an integer')
+	p_values = np.asarray(p_values, dtype=float)
+	if mode not in MODES:
+		raise ValueError('Invalid mode selected')
+	if mode == 'range':
+		if right is None:
+			raise ValueError('Right must be given for range queries')
+		if x > right:
+			raise ValueError('Left must be less than or equal to right')
+	if np.any(n_values < 1):
+		raise ValueError('Number of trials (n) must be greater than 0')
+	if np.any((p_values < 0) | (p_values > 1)):
+		raise ValueError('Probability (p) must be between 0 and 1 inclusive')
+
+	if workers is None:
+		workers = os.cpu_count() or 1
+	workers = min(workers, len(n_values))
+	if workers <= 1 or n_values.size * p_values.size < MIN_PARALLEL_CELLS:
+		return evaluate(n_values, p_values, mode, x, right)
+
+	n_chunks = np.array_split(n_values, workers)
+	with ProcessPoolExecutor(workers) as executor:
+		results = executor.map(evaluate, n_chunks, [p_values] * workers, [mode] * workers, [x] * workers,
+		                       [right] * workers)
+		return np.concatenate(list(results))